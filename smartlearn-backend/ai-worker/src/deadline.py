@@ -0,0 +1,33 @@
+import time
+from typing import Dict, Any, Optional
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a job runs out of its end-to-end time budget"""
+
+
+class Deadline:
+    """Absolute wall-clock deadline shared by every stage of a job"""
+
+    def __init__(self, expires_at: float):
+        self.expires_at = expires_at
+
+    @classmethod
+    def for_job(cls, job_data: Dict[str, Any], default_timeout: float) -> 'Deadline':
+        """Use the backend's deadline (epoch ms) if given, capped by the worker's own job timeout"""
+        expires_at = time.time() + default_timeout
+        if job_data.get('deadline'):
+            expires_at = min(expires_at, float(job_data['deadline']) / 1000)
+        return cls(expires_at)
+
+    def remaining(self) -> float:
+        return self.expires_at - time.time()
+
+    def check(self, stage: str):
+        if self.remaining() <= 0:
+            raise DeadlineExceeded(f"Deadline exceeded during {stage}")
+
+    def timeout(self, cap: float, stage: Optional[str] = None) -> float:
+        """Per-call timeout: the remaining budget, never more than cap"""
+        self.check(stage or "request")
+        return min(cap, self.remaining())
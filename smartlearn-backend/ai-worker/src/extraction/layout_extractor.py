@@ -0,0 +1,131 @@
+import re
+import math
+import logging
+from collections import Counter
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Block signature: lowercase, digits folded so "Page 3" and "Page 17" match
+_DIGITS_RE = re.compile(r'\d+')
+_SPACE_RE = re.compile(r'\s+')
+
+# "12", "page 3", "3 of 20", "- 4 -"
+_PAGE_NUMBER_RE = re.compile(r'^[-–\s]*(page\s*)?#(\s*(of|/)\s*#)?[-–\s]*$')
+
+# Table-of-contents lines: "1.2 Introduction ........ 14"
+_DOT_LEADER_RE = re.compile(r'^.*?(?:\.\s?){4,}\s*\d+\s*$', re.MULTILINE)
+
+_REFERENCE_HEADINGS = {
+    'references', 'bibliography', 'works cited', 'literature cited', 'reference list'
+}
+
+# Headings that end a reference section: "Appendix A", "Chapter #", "Part IV: ..."
+_KEYWORD_HEADING_RE = re.compile(r'^(?:appendix|annex|chapter|part)\s+(?:[a-z]|[ivxlc]+|#(?:\.#)*)(?:[.:\s–-]|$)')
+# Numbered headings: "# Results", "#.# Methods"
+_NUMBERED_HEADING_RE = re.compile(r'^#(?:\.#)*\.?\s+[a-z]')
+# Citation markers that numbered reference entries carry but headings don't
+_YEAR_RE = re.compile(r'\b(?:1[5-9]|20)\d\d\b')
+
+# Hyphenated line break or any whitespace run, handled in a single pass
+_NORMALIZE_RE = re.compile(r'(?<=\w)[-­][ \t]*\n\s*(?=\w)|\s+')
+
+
+def normalize_text(text: str) -> str:
+    """De-hyphenate line breaks and collapse whitespace in one pass"""
+    return _NORMALIZE_RE.sub(lambda m: ' ' if m.group(0)[0].isspace() else '', text).strip()
+
+
+class LayoutExtractor:
+    """Layout-aware PDF text extraction that strips repeated boilerplate"""
+
+    def __init__(self, margin_ratio: float = 0.08, repeat_ratio: float = 0.5):
+        # Blocks starting/ending inside this fraction of the page height are header/footer candidates
+        self.margin_ratio = margin_ratio
+        # A block seen on at least this fraction of pages is treated as boilerplate
+        self.repeat_ratio = repeat_ratio
+
+    def extract(self, doc, page_indices: Optional[List[int]] = None, deadline=None) -> str:
+        """Extract cleaned text from an open fitz document (optionally a subset of pages)"""
+        if page_indices is None:
+            page_indices = range(len(doc))
+
+        pages = []
+        for i in page_indices:
+            if deadline:
+                deadline.check("extract")
+            pages.append(self._page_blocks(doc.load_page(i)))
+        if not pages:
+            return ""
+
+        repeated = self._find_repeated(pages)
+        kept = []
+        dropped = 0
+        in_references = False
+
+        for page_index, blocks in enumerate(pages):
+            for text, signature, in_margin in blocks:
+                if in_margin and (signature in repeated or _PAGE_NUMBER_RE.match(signature)):
+                    dropped += len(text)
+                    continue
+
+                if self._is_reference_heading(signature) and page_index >= len(pages) // 2:
+                    logger.info(f"✂️ Dropping reference section from page {page_index + 1}")
+                    in_references = True
+                    continue
+
+                if in_references:
+                    if not self._is_section_heading(text, signature):
+                        continue
+                    # Appendices and later chapters follow the references
+                    in_references = False
+
+                kept.append(text)
+
+        return self._finish(kept, dropped)
+
+    def _page_blocks(self, page) -> List[Tuple[str, str, bool]]:
+        """Return (text, signature, in_margin) for each text block on a page"""
+        height = page.rect.height or 1
+        top = height * self.margin_ratio
+        bottom = height * (1 - self.margin_ratio)
+
+        blocks = []
+        for x0, y0, x1, y1, text, _block_no, block_type in page.get_text("blocks", sort=True):
+            if block_type != 0 or not text.strip():
+                continue
+            signature = _SPACE_RE.sub(' ', _DIGITS_RE.sub('#', text.lower())).strip()
+            blocks.append((text, signature, y1 <= top or y0 >= bottom))
+        return blocks
+
+    def _find_repeated(self, pages: List[List[Tuple[str, str, bool]]]) -> set:
+        """Find header/footer blocks that recur across many pages"""
+        if len(pages) < 2:
+            return set()
+
+        threshold = max(2, math.ceil(len(pages) * self.repeat_ratio))
+        counts = Counter()
+        for blocks in pages:
+            # Count each signature once per page
+            counts.update({sig for _, sig, in_margin in blocks if in_margin})
+
+        return {sig for sig, count in counts.items() if count >= threshold}
+
+    def _is_reference_heading(self, signature: str) -> bool:
+        return signature.rstrip(':').lstrip('#. ') in _REFERENCE_HEADINGS
+
+    def _is_section_heading(self, text: str, signature: str) -> bool:
+        """Short heading block that starts a new section (not a numbered reference entry)"""
+        if len(signature) > 80 or signature.endswith('.'):
+            return False
+        if _KEYWORD_HEADING_RE.match(signature):
+            return True
+        return (bool(_NUMBERED_HEADING_RE.match(signature))
+                and ',' not in signature and not _YEAR_RE.search(text))
+
+    def _finish(self, kept: List[str], dropped: int) -> str:
+        text = _DOT_LEADER_RE.sub('', "\n".join(kept))
+        text = normalize_text(text)
+        if dropped:
+            logger.info(f"🧹 Stripped {dropped} characters of repeated headers/footers")
+        return text
@@ -0,0 +1,60 @@
+import logging
+from typing import List, Optional
+
+from deadline import Deadline, DeadlineExceeded
+
+logger = logging.getLogger(__name__)
+
+
+def sample_pages(page_count: int, max_pages: Optional[int]) -> List[int]:
+    """Pick evenly spaced page indices when a document exceeds the page cap"""
+    if not max_pages or page_count <= max_pages:
+        return list(range(page_count))
+    if max_pages == 1:
+        return [0]
+    step = (page_count - 1) / (max_pages - 1)
+    return sorted({round(i * step) for i in range(max_pages)})
+
+
+def extract_text_from_pdf(pdf_content: bytes, mode: str = 'layout',
+                          max_pages: Optional[int] = None, deadline: Optional[Deadline] = None) -> Optional[str]:
+    """Extract text from PDF content.
+
+    Module-level so it can run in a worker process of the extraction stage.
+    """
+    try:
+        import fitz  # PyMuPDF
+
+        logger.info(f"📄 Extracting text from PDF ({mode} mode)...")
+        doc = fitz.open(stream=pdf_content, filetype="pdf")
+
+        page_indices = sample_pages(len(doc), max_pages)
+        if len(page_indices) < len(doc):
+            logger.warning(f"⚠️ Large document: sampling {len(page_indices)} of {len(doc)} pages")
+
+        if mode == 'layout':
+            from extraction.layout_extractor import LayoutExtractor
+            text = LayoutExtractor().extract(doc, page_indices, deadline)
+        else:
+            text = ""
+            for page_num in page_indices:
+                if deadline:
+                    deadline.check("extract")
+                page = doc.load_page(page_num)
+                text += page.get_text()
+
+        doc.close()
+
+        text = text.strip()
+        if not text:
+            logger.warning("⚠️ No text extracted from PDF")
+            return None
+
+        logger.info(f"✅ Extracted {len(text)} characters from PDF")
+        return text
+
+    except DeadlineExceeded:
+        raise
+    except Exception as e:
+        logger.error(f"❌ PDF text extraction failed: {e}")
+        return None
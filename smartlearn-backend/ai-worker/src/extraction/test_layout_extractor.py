@@ -0,0 +1,53 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def build_fixture_pdf():
+    """Six pages with a running header/footer, a numbered reference list and an appendix"""
+    import fitz  # PyMuPDF
+
+    doc = fitz.open()
+    page_count = 6
+    for number in range(1, page_count + 1):
+        page = doc.new_page(width=595, height=842)
+        page.insert_text((72, 30), "SmartLearn Course Notes - Biology 101", fontsize=9)
+        page.insert_text((280, 825), f"Page {number} of {page_count}", fontsize=9)
+
+        if number <= 4:
+            page.insert_text((72, 150), "Key Points", fontsize=14)
+            page.insert_text((72, 200), f"Cells are the basic unit of life, topic {number}.", fontsize=11)
+        elif number == 5:
+            page.insert_text((72, 150), f"Mitochondria produce ATP, topic {number}.", fontsize=11)
+            page.insert_text((72, 250), "References", fontsize=14)
+            page.insert_text((72, 300), "1. Smith, J. (2019). Deep learning. Nature, 521, 436-444", fontsize=10)
+            page.insert_text((72, 350), "2. Doe, A. (2020). Cell biology review. Science, 12, 1-9", fontsize=10)
+            page.insert_text((72, 400), "Part of this work appeared in Proc. ICML 2018", fontsize=10)
+        else:
+            page.insert_text((72, 150), "Appendix A: Derivations", fontsize=14)
+            page.insert_text((72, 200), "The derivation of the membrane potential follows.", fontsize=11)
+    return doc
+
+def test_layout_extractor():
+    """Boilerplate, page numbers and the reference list are stripped; body and appendix are kept"""
+    from extraction.layout_extractor import LayoutExtractor
+
+    doc = build_fixture_pdf()
+    try:
+        text = LayoutExtractor().extract(doc)
+    finally:
+        doc.close()
+    print(f"📄 Extracted: {text}")
+
+    assert "SmartLearn Course Notes" not in text, "Running header was kept"
+    assert "Page 3 of 6" not in text, "Page number footer was kept"
+    assert text.count("Key Points") == 4, "Repeated body heading was stripped"
+    assert "Mitochondria produce ATP" in text, "Body text before the references was dropped"
+    assert "Smith" not in text and "Doe" not in text, "Numbered reference entries were kept"
+    assert "ICML" not in text, "Reference continuation was kept"
+    assert "Appendix A: Derivations" in text, "Appendix heading after the references was dropped"
+    assert "membrane potential" in text, "Appendix body after the references was dropped"
+    print("✅ Layout extraction fixture passed")
+
+if __name__ == "__main__":
+    test_layout_extractor()
@@ -0,0 +1,69 @@
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Callable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# report() -> (live, ready, details)
+HealthReport = Callable[[], Tuple[bool, bool, Dict[str, Any]]]
+
+
+class HealthServer:
+    """Serves liveness and readiness endpoints for orchestrators.
+
+    GET /health/live   200 while the worker loop is running, else 503
+    GET /health/ready  200 while the worker can take more jobs, 503 when saturated
+    GET /health        full load report (always 200)
+    """
+
+    def __init__(self, report: HealthReport, port: int = 8000):
+        self.report = report
+        self.port = port
+        self.server = None
+
+    def start(self):
+        report = self.report
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                try:
+                    live, ready, details = report()
+                except Exception as e:
+                    logger.error(f"❌ Health report failed: {e}")
+                    self._send(503, {'status': 'error', 'error': str(e)})
+                    return
+
+                body = {'live': live, 'ready': ready, **details}
+                if self.path == '/health/live':
+                    self._send(200 if live else 503, body)
+                elif self.path == '/health/ready':
+                    self._send(200 if ready else 503, body)
+                elif self.path == '/health':
+                    self._send(200, body)
+                else:
+                    self._send(404, {'error': 'Not found'})
+
+            def _send(self, status: int, body: Dict[str, Any]):
+                payload = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                # Probes hit this every few seconds; keep them out of the worker log
+                pass
+
+        self.server = ThreadingHTTPServer(('0.0.0.0', self.port), Handler)
+        self.server.daemon_threads = True
+        thread = threading.Thread(target=self.server.serve_forever, name="health", daemon=True)
+        thread.start()
+        logger.info(f"🩺 Health endpoints listening on :{self.port}")
+
+    def stop(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
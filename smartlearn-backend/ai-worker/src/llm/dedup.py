@@ -0,0 +1,77 @@
+import re
+import zlib
+import logging
+from typing import List, Dict, Any, Set
+
+try:
+    import numpy as np
+except ImportError:  # Exact Jaccard fallback below
+    np = None
+
+logger = logging.getLogger(__name__)
+
+_NON_WORD_RE = re.compile(r'[^a-z0-9 ]+')
+_SPACE_RE = re.compile(r'\s+')
+
+
+def shingles(text: str, size: int = 5) -> Set[int]:
+    """Hashed character shingles of normalized text"""
+    text = _SPACE_RE.sub(' ', _NON_WORD_RE.sub(' ', text.lower())).strip()
+    if len(text) <= size:
+        return {zlib.crc32(text.encode('utf-8'))}
+    return {zlib.crc32(text[i:i + size].encode('utf-8')) for i in range(len(text) - size + 1)}
+
+
+def option_shingles(options: List[Any]) -> Set[int]:
+    """Shingles of an option set, independent of option order"""
+    return set().union(*(shingles(str(option)) for option in options)) or shingles('')
+
+
+class MCQDeduplicator:
+    """Drops near-duplicate MCQs within a job using MinHash signatures.
+
+    Two MCQs are near-duplicates only when their question texts are similar and
+    their option sets are similar too: different questions often share an option
+    set, and near-identical wording can ask about a different answer set.
+    Signatures and the pairwise similarity matrices are computed with NumPy;
+    without it, exact Jaccard similarity over the shingle sets is used instead.
+    """
+
+    def __init__(self, threshold: float = 0.7, num_perm: int = 128, seed: int = 1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        if np is not None:
+            rng = np.random.default_rng(seed)
+            # Multiply-shift hashing: odd multipliers, uint64 arithmetic wraps
+            self.a = rng.integers(1, 2 ** 63, size=num_perm, dtype=np.uint64) | np.uint64(1)
+            self.b = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)
+
+    def deduplicate(self, mcqs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Keep the first of each group of near-duplicate MCQs, preserving order"""
+        if len(mcqs) < 2:
+            return list(mcqs)
+
+        question_sim = self._similarity([shingles(m['question']) for m in mcqs])
+        option_sim = self._similarity([option_shingles(m.get('options', [])) for m in mcqs])
+
+        kept: List[int] = []
+        for i in range(len(mcqs)):
+            if not any(question_sim[i][j] >= self.threshold and option_sim[i][j] >= self.threshold
+                       for j in kept):
+                kept.append(i)
+
+        if len(kept) < len(mcqs):
+            logger.info(f"🧹 Dropped {len(mcqs) - len(kept)} near-duplicate MCQs")
+        return [mcqs[i] for i in kept]
+
+    def _similarity(self, shingle_sets: List[Set[int]]):
+        """Pairwise (estimated) Jaccard similarity matrix"""
+        if np is None:
+            return [[len(a & b) / len(a | b) for b in shingle_sets] for a in shingle_sets]
+
+        signatures = np.empty((len(shingle_sets), self.num_perm), dtype=np.uint64)
+        for row, shingle_set in enumerate(shingle_sets):
+            values = np.fromiter(shingle_set, dtype=np.uint64, count=len(shingle_set))
+            signatures[row] = (np.outer(values, self.a) + self.b).min(axis=0)
+
+        return (signatures[:, None, :] == signatures[None, :, :]).mean(axis=2)
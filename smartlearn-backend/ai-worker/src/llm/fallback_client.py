@@ -28,8 +28,9 @@ class FallbackClient:
             "Completely unrelated to the text topic"
         ]
     
-    def generate_mcqs(self, text: str, question_count: int = 5, difficulty: str = "medium") -> List[Dict[str, Any]]:
-        """Generate fallback MCQs based on text analysis"""
+    def generate_mcqs(self, text: str, question_count: int = 5, difficulty: str = "medium",
+                      timeout: float = None, exclude: List[str] = None) -> List[Dict[str, Any]]:
+        """Generate fallback MCQs based on text analysis (local, so timeout is unused)"""
         
         logger.info(f"🔄 Generating {question_count} fallback MCQs")
         
@@ -37,7 +38,8 @@ class FallbackClient:
         topics = self._extract_key_phrases(text)
         
         mcqs = []
-        templates_used = self.question_templates.copy()
+        excluded = set(exclude or [])
+        templates_used = [t for t in self.question_templates if t not in excluded]
         random.shuffle(templates_used)
         
         for i in range(min(question_count, len(templates_used))):
@@ -52,12 +54,9 @@ class FallbackClient:
             }
             mcqs.append(mcq)
         
-        # Ensure we have exactly the requested number
-        while len(mcqs) < question_count:
-            base_mcq = random.choice(mcqs)
-            new_mcq = base_mcq.copy()
-            new_mcq["question"] = new_mcq["question"] + " (Additional)"
-            mcqs.append(new_mcq)
+        # Fewer distinct questions beat padded copies of the same one
+        if len(mcqs) < question_count:
+            logger.warning(f"⚠️ Only {len(mcqs)} distinct fallback questions available")
         
         logger.info(f"✅ Generated {len(mcqs)} fallback MCQs")
         return mcqs
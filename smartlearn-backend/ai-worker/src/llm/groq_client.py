@@ -1,5 +1,6 @@
 import os
 import json
+import time
 import logging
 from typing import List, Dict, Any
 import requests
@@ -14,9 +15,11 @@ class GroqClient:
         self.api_key = api_key
         self.base_url = "https://api.groq.com/openai/v1"
         self.default_model = "llama-3.1-8b-instant"  # Fast and reliable
+        self.last_rate_limited_at = None  # Reported by the worker health endpoint
         
-    def generate_mcqs(self, text: str, question_count: int = 5, difficulty: str = "medium") -> List[Dict[str, Any]]:
-        """Generate MCQs using Groq API"""
+    def generate_mcqs(self, text: str, question_count: int = 5, difficulty: str = "medium",
+                      timeout: float = 45, exclude: List[str] = None) -> List[Dict[str, Any]]:
+        """Generate MCQs using Groq API, avoiding questions listed in exclude"""
         
         # Validate input
         if not text or len(text.strip()) < 20:
@@ -24,7 +27,7 @@ class GroqClient:
             return self._generate_fallback_mcqs(question_count)
         
         # Prepare prompt
-        prompt = self._create_prompt(text, question_count, difficulty)
+        prompt = self._create_prompt(text, question_count, difficulty, exclude)
         
         try:
             response = requests.post(
@@ -49,7 +52,7 @@ class GroqClient:
                     "max_tokens": 2000,
                     "response_format": {"type": "json_object"}
                 },
-                timeout=45
+                timeout=timeout
             )
             
             # Handle API errors
@@ -61,6 +64,7 @@ class GroqClient:
                     error_msg = "Invalid API key"
                 elif response.status_code == 429:
                     error_msg = "Rate limit exceeded"
+                    self.last_rate_limited_at = time.time()
                 
                 logger.error(f"❌ Groq API: {error_msg}")
                 return self._generate_fallback_mcqs(question_count)
@@ -113,8 +117,16 @@ class GroqClient:
                 isinstance(mcq['correct_index'], int) and
                 0 <= mcq['correct_index'] <= 3)
     
-    def _create_prompt(self, text: str, question_count: int, difficulty: str) -> str:
+    def _create_prompt(self, text: str, question_count: int, difficulty: str,
+                       exclude: List[str] = None) -> str:
         """Create prompt for MCQ generation"""
+        exclusions = ""
+        if exclude:
+            existing = "\n".join(f"- {question}" for question in exclude)
+            exclusions = f"""
+EXISTING QUESTIONS (do not repeat or paraphrase these, cover different concepts):
+{existing}
+"""
         return f"""
 Generate {question_count} multiple-choice questions based on the text below.
 
@@ -122,7 +134,7 @@ TEXT:
 {text}
 
 DIFFICULTY: {difficulty}
-
+{exclusions}
 INSTRUCTIONS:
 - Create exactly {question_count} diverse questions
 - Each question must have exactly 4 options
@@ -160,7 +172,8 @@ Return ONLY valid JSON.
                     "General knowledge not specific to the text"
                 ],
                 "correct_index": 0,
-                "explanation": "This option reflects the primary content discussed in the provided text."
+                "explanation": "This option reflects the primary content discussed in the provided text.",
+                "placeholder": True  # Lets callers tell these apart from generated questions
             }
             mcqs.append(mcq)
         
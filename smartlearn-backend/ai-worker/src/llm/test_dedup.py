@@ -0,0 +1,61 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ORGANELLES = ["Chloroplast", "Mitochondrion", "Nucleus", "Ribosome"]
+
+MCQS = [
+    {"question": "Which organelle produces ATP in the cell?", "options": ORGANELLES},
+    # Reworded duplicate with the same options in another order: dropped
+    {"question": "Which organelle produces the ATP in the cell?", "options": list(reversed(ORGANELLES))},
+    {"question": "Which organelle performs photosynthesis in plant cells?", "options": ORGANELLES},
+    # Near-identical wording but a different answer set: kept
+    {"question": "Which organelle performs photosynthesis in animal cells?",
+     "options": ["None of them", "Only in cell walls", "Vacuole", "Cytoplasm"]},
+    # Shared options but a different question: kept
+    {"question": "Where is most of the cell's DNA stored?", "options": ORGANELLES},
+]
+
+EXPECTED = [MCQS[0], MCQS[2], MCQS[3], MCQS[4]]
+
+def check_paths(numpy_enabled: bool):
+    """Run the similarity matrix and deduplication on one of the two code paths"""
+    from llm import dedup
+
+    numpy_module = dedup.np
+    if not numpy_enabled:
+        dedup.np = None
+    try:
+        deduplicator = dedup.MCQDeduplicator(threshold=0.7)
+        sets = [dedup.shingles(mcq['question']) for mcq in MCQS]
+        similarity = deduplicator._similarity(sets)
+
+        for i, a in enumerate(sets):
+            for j, b in enumerate(sets):
+                exact = len(a & b) / len(a | b)
+                # MinHash estimates with 128 permutations stay close to the exact Jaccard similarity
+                tolerance = 0.15 if numpy_enabled else 0
+                assert abs(similarity[i][j] - exact) <= tolerance, \
+                    f"Similarity {similarity[i][j]:.2f} vs exact {exact:.2f} for MCQs {i} and {j}"
+
+        kept = deduplicator.deduplicate(MCQS)
+        assert kept == EXPECTED, f"Kept {[mcq['question'] for mcq in kept]}"
+    finally:
+        dedup.np = numpy_module
+
+def test_dedup():
+    """Questions are dropped only when both question and option text are similar"""
+    from llm import dedup
+
+    if dedup.np is not None:
+        check_paths(numpy_enabled=True)
+        print("✅ MinHash (NumPy) deduplication passed")
+    else:
+        print("⚠️ NumPy not installed, skipping the MinHash path")
+
+    check_paths(numpy_enabled=False)
+    print("✅ Exact Jaccard deduplication passed")
+
+if __name__ == "__main__":
+    test_dedup()
@@ -0,0 +1,91 @@
+import logging
+import threading
+from typing import Dict, Any, Optional
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+
+class FileTooLargeError(Exception):
+    """Raised when a document is beyond what the worker will hold at all"""
+
+
+class MemoryBudget:
+    """Process-wide memory accounting with blocking admission control.
+
+    Jobs reserve an estimated number of bytes before their document is held in
+    memory and release them when they finish. A job that does not fit waits
+    until enough in-flight jobs have released; a job larger than the whole
+    budget is admitted alone and capped to the full budget, so callers degrade
+    it (page caps/sampling) instead of letting it grow unbounded.
+    """
+
+    # Rough working set per job: raw PDF + fitz document + extracted text
+    FILE_OVERHEAD = 3
+    PER_PAGE_BYTES = 256 * 1024
+    AVG_PAGE_BYTES = 50 * 1024
+    # Extracted text plus its preprocessed copy, once the PDF is gone
+    TEXT_OVERHEAD = 2
+
+    def __init__(self, total_bytes: int):
+        self.total_bytes = total_bytes
+        self.reserved: Dict[str, int] = {}
+        self.condition = threading.Condition()
+
+    @classmethod
+    def estimate(cls, file_size: int, page_count: Optional[int] = None) -> int:
+        """Estimate the bytes a job needs from its file size and page count"""
+        if page_count is None:
+            page_count = max(1, file_size // cls.AVG_PAGE_BYTES)
+        return file_size * cls.FILE_OVERHEAD + page_count * cls.PER_PAGE_BYTES
+
+    @classmethod
+    def page_cap(cls, file_size: int, granted: int) -> int:
+        """Number of pages affordable within a granted reservation"""
+        return max(1, (granted - file_size * cls.FILE_OVERHEAD) // cls.PER_PAGE_BYTES)
+
+    def acquire(self, job_id: str, nbytes: int, timeout: Optional[float] = None) -> int:
+        """Set a job's reservation, blocking until it fits. Returns the bytes granted.
+
+        Calling it again for the same job replaces the earlier reservation, so an
+        estimate can be refined once the real page count is known. An admitted job
+        never waits to grow (two growing jobs could block each other); it gets what
+        is free and the caller degrades it.
+        """
+        granted = min(nbytes, self.total_bytes)
+        with self.condition:
+            current = self.reserved.get(job_id, 0)
+            if current:
+                granted = min(granted, self.total_bytes - (self.used() - current))
+            fits = self.condition.wait_for(
+                lambda: self.used() - current + granted <= self.total_bytes, timeout=timeout
+            )
+            if not fits:
+                raise TimeoutError(f"Memory budget unavailable for {granted // MB} MB")
+            self.reserved[job_id] = granted
+            if granted < current:
+                self.condition.notify_all()
+
+        if granted < nbytes:
+            logger.warning(f"⚠️ Job {job_id} needs ~{nbytes // MB} MB, capped to {granted // MB} MB")
+        return granted
+
+    def release(self, job_id: str):
+        with self.condition:
+            if self.reserved.pop(job_id, None) is not None:
+                self.condition.notify_all()
+
+    def used(self) -> int:
+        return sum(self.reserved.values())
+
+    def stats(self) -> Dict[str, Any]:
+        with self.condition:
+            used = self.used()
+            jobs = len(self.reserved)
+        return {
+            'budget_mb': round(self.total_bytes / MB, 1),
+            'reserved_mb': round(used / MB, 1),
+            'headroom_mb': round((self.total_bytes - used) / MB, 1),
+            'jobs': jobs
+        }
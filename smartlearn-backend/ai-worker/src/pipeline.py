@@ -0,0 +1,235 @@
+import time
+import queue
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Executor, BrokenExecutor
+from typing import Dict, Any, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class Stage:
+    """One pipeline step with its own executor, concurrency limit and input queue"""
+
+    def __init__(self, name: str, handler: Callable[[Dict[str, Any]], Dict[str, Any]],
+                 executor_factory: Callable[[], Executor], concurrency: int, queue_size: int,
+                 on_result: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.name = name
+        self.handler = handler
+        # Runs in this process on each result, e.g. after a handler ran in a worker process
+        self.on_result = on_result
+        self.executor_factory = executor_factory
+        self.executor = executor_factory()
+        self.restarts = 0
+        self.broken = False
+        self.concurrency = concurrency
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.active = 0
+        self.latencies = deque(maxlen=100)
+        self.lock = threading.Lock()
+
+    def queue_lag(self) -> float:
+        """Seconds the oldest queued job has been waiting"""
+        with self.queue.mutex:
+            head = self.queue.queue[0] if self.queue.queue else None
+        if head is None or head is _STOP:
+            return 0.0
+        return time.time() - head[1]
+
+    def stats(self) -> Dict[str, Any]:
+        with self.lock:
+            latencies = sorted(self.latencies)
+            active = self.active
+        return {
+            'queue_depth': self.queue.qsize(),
+            'queue_capacity': self.queue.maxsize,
+            'queue_lag_seconds': round(self.queue_lag(), 3),
+            'active': active,
+            'concurrency': self.concurrency,
+            'executor_restarts': self.restarts,
+            'broken': self.broken,
+            **_latency_stats(latencies)
+        }
+
+
+def _latency_stats(latencies: List[float]) -> Dict[str, Any]:
+    """p50/max of sorted recent latencies"""
+    return {
+        'p50_seconds': round(latencies[len(latencies) // 2], 3) if latencies else None,
+        'max_seconds': round(latencies[-1], 3) if latencies else None
+    }
+
+
+class JobTracker:
+    """In-flight count and per-stage latencies for jobs run outside the pipeline (BullMQ path)"""
+
+    def __init__(self, stage_names: List[str], concurrency: int):
+        self.concurrency = concurrency
+        self.in_flight = 0
+        self.active = {name: 0 for name in stage_names}
+        self.latencies = {name: deque(maxlen=100) for name in stage_names}
+        self.lock = threading.Lock()
+
+    def track_job(self, delta: int):
+        with self.lock:
+            self.in_flight += delta
+
+    def run(self, name: str, handler: Callable[[Dict[str, Any]], Dict[str, Any]],
+            job: Dict[str, Any]) -> Dict[str, Any]:
+        with self.lock:
+            self.active[name] += 1
+        started = time.time()
+        try:
+            return handler(job)
+        finally:
+            with self.lock:
+                self.active[name] -= 1
+                self.latencies[name].append(time.time() - started)
+
+    def is_full(self) -> bool:
+        return self.in_flight >= self.concurrency
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self.lock:
+            return {
+                name: {'active': self.active[name], **_latency_stats(sorted(self.latencies[name]))}
+                for name in self.latencies
+            }
+
+
+class StagedPipeline:
+    """Runs jobs through stages connected by bounded queues.
+
+    Each stage pulls from its own queue with `concurrency` runner threads and
+    executes the handler on the stage's executor. A full downstream queue blocks
+    the runners, which in turn fills the upstream queue, so `submit` blocks when
+    the whole pipeline is saturated.
+    """
+
+    def __init__(self, on_error: Callable[[Dict[str, Any], str, Exception], None],
+                 on_complete: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.stages: List[Stage] = []
+        self.on_error = on_error
+        self.on_complete = on_complete
+        self.threads: List[threading.Thread] = []
+        self.in_flight = 0
+        self.in_flight_lock = threading.Lock()
+
+    def add_stage(self, name: str, handler: Callable[[Dict[str, Any]], Dict[str, Any]],
+                  executor_factory: Callable[[], Executor], concurrency: int,
+                  queue_size: int = 4,
+                  on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> 'StagedPipeline':
+        self.stages.append(Stage(name, handler, executor_factory, concurrency, queue_size, on_result))
+        return self
+
+    def start(self):
+        for index, stage in enumerate(self.stages):
+            for n in range(stage.concurrency):
+                thread = threading.Thread(
+                    target=self._run_stage, args=(index,), name=f"{stage.name}-{n}", daemon=True
+                )
+                thread.start()
+                self.threads.append(thread)
+        logger.info("🏭 Pipeline started: " + " → ".join(
+            f"{s.name}[{s.concurrency}]" for s in self.stages
+        ))
+
+    def submit(self, job: Dict[str, Any], timeout: Optional[float] = None):
+        """Enqueue a job on the first stage, blocking while the pipeline is full"""
+        self._track(1)
+        try:
+            self.stages[0].queue.put((job, time.time()), timeout=timeout)
+        except queue.Full:
+            self._track(-1)
+            raise
+
+    def alive(self) -> bool:
+        """True while every stage runner thread is running and no executor is unusable"""
+        return (bool(self.threads) and all(thread.is_alive() for thread in self.threads)
+                and not any(stage.broken for stage in self.stages))
+
+    def is_full(self) -> bool:
+        """True when the first stage cannot take another job without blocking"""
+        return self.stages[0].queue.full()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {stage.name: stage.stats() for stage in self.stages}
+
+    def shutdown(self, wait: bool = True):
+        for stage in self.stages:
+            for _ in range(stage.concurrency):
+                stage.queue.put(_STOP)
+        if wait:
+            for thread in self.threads:
+                thread.join()
+        for stage in self.stages:
+            stage.executor.shutdown(wait=wait)
+
+    def _run_stage(self, index: int):
+        stage = self.stages[index]
+        next_stage = self.stages[index + 1] if index + 1 < len(self.stages) else None
+
+        while True:
+            item = stage.queue.get()
+            if item is _STOP:
+                return
+            job, _enqueued_at = item
+
+            with stage.lock:
+                stage.active += 1
+            started = time.time()
+            executor = stage.executor
+            try:
+                result = executor.submit(stage.handler, job).result()
+                if stage.on_result:
+                    stage.on_result(result)
+            except BrokenExecutor as e:
+                # A worker process died (segfault, OOM kill); later jobs need a fresh pool
+                self._rebuild_executor(stage, executor)
+                self._safe_call(self.on_error, job, stage.name, Exception(f"{stage.name} worker crashed: {e}"))
+                self._track(-1)
+                continue
+            except Exception as e:
+                self._safe_call(self.on_error, job, stage.name, e)
+                self._track(-1)
+                continue
+            finally:
+                with stage.lock:
+                    stage.active -= 1
+                    stage.latencies.append(time.time() - started)
+
+            if next_stage is not None:
+                # Blocks while the next stage is full (backpressure)
+                next_stage.queue.put((result, time.time()))
+            else:
+                if self.on_complete:
+                    self._safe_call(self.on_complete, result)
+                self._track(-1)
+
+    def _rebuild_executor(self, stage: Stage, broken: Executor):
+        with stage.lock:
+            if stage.executor is not broken:
+                return  # Another runner already replaced it
+            try:
+                stage.executor = stage.executor_factory()
+                stage.restarts += 1
+                stage.broken = False
+                logger.warning(f"♻️ Rebuilt '{stage.name}' executor after a worker crash")
+            except Exception as e:
+                stage.broken = True
+                logger.error(f"❌ Failed to rebuild '{stage.name}' executor: {e}")
+                return
+        broken.shutdown(wait=False)
+
+    def _track(self, delta: int):
+        with self.in_flight_lock:
+            self.in_flight += delta
+
+    def _safe_call(self, callback: Callable, *args):
+        try:
+            callback(*args)
+        except Exception as e:
+            logger.error(f"❌ Pipeline callback error: {e}")
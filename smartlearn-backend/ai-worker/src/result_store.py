@@ -0,0 +1,191 @@
+import json
+import time
+import uuid
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (job_id, result, on_done(persisted))
+PendingResult = Tuple[str, Dict[str, Any], Callable[[bool], None]]
+
+
+class BulkResultWriter:
+    """Buffers completed job results and writes them to Postgres in batches.
+
+    Mirrors the backend's completeJob (quiz + questions + job/file status) but
+    commits a whole batch in one transaction with multi-row inserts. Jobs that
+    already have a quiz are skipped, so redelivered results for the same jobId
+    are idempotent.
+
+    Completion callbacks (which may fall back to slow HTTP calls) run on their
+    own pool so they never hold up later flushes. Buffered results plus pending
+    callbacks are capped at max_pending; submit blocks beyond that.
+    """
+
+    def __init__(self, database_url: str, batch_size: int = 20,
+                 flush_interval: float = 0.5, pool_size: int = 4,
+                 max_pending: int = None, callback_workers: int = 4):
+        from psycopg2.pool import ThreadedConnectionPool
+
+        self.pool = ThreadedConnectionPool(1, pool_size, database_url)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending or batch_size * 4
+        self.buffer: List[PendingResult] = []
+        self.callbacks_pending = 0
+        self.callbacks = ThreadPoolExecutor(callback_workers, thread_name_prefix="result-callback")
+        self.condition = threading.Condition()
+        self.closed = False
+        self.thread = threading.Thread(target=self._run, name="result-writer", daemon=True)
+        self.thread.start()
+        logger.info(f"🗄️ Direct result persistence enabled (batch size {batch_size})")
+
+    def submit(self, job_id: str, result: Dict[str, Any], on_done: Callable[[bool], None]):
+        """Queue a completed result; on_done(persisted) is called after its batch commits or fails.
+
+        Blocks while max_pending results are buffered or awaiting their callback.
+        """
+        with self.condition:
+            self.condition.wait_for(
+                lambda: self.closed or len(self.buffer) + self.callbacks_pending < self.max_pending
+            )
+            if not self.closed:
+                self.buffer.append((job_id, result, on_done))
+                self.condition.notify_all()
+                return
+
+        # Writer already shut down; let the caller fall back
+        on_done(False)
+
+    def close(self):
+        """Flush buffered results, wait for their callbacks, then close connections"""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        self.thread.join()
+        self.callbacks.shutdown(wait=True)
+        self.pool.closeall()
+        logger.info("🗄️ Result writer closed")
+
+    def _run(self):
+        while True:
+            with self.condition:
+                self.condition.wait_for(
+                    lambda: self.closed or len(self.buffer) >= self.batch_size,
+                    timeout=self.flush_interval
+                )
+                batch, self.buffer = self.buffer, []
+                closed = self.closed
+
+            if batch:
+                self._flush(batch)
+            if closed:
+                return
+
+    def _flush(self, batch: List[PendingResult]):
+        started = time.time()
+        # Last result wins for duplicate jobIds within a batch
+        pending = {job_id: (result, on_done) for job_id, result, on_done in batch}
+
+        try:
+            persisted = self.write_batch({job_id: result for job_id, (result, _) in pending.items()})
+        except Exception as e:
+            logger.error(f"❌ Bulk result write failed for {len(pending)} jobs: {e}")
+            persisted = set()
+        else:
+            logger.info(f"🗄️ Persisted {len(persisted)}/{len(pending)} results in {time.time() - started:.2f}s")
+
+        with self.condition:
+            self.callbacks_pending += len(pending)
+        for job_id, (_, on_done) in pending.items():
+            self.callbacks.submit(self._run_callback, job_id, on_done, job_id in persisted)
+
+    def _run_callback(self, job_id: str, on_done: Callable[[bool], None], persisted: bool):
+        try:
+            on_done(persisted)
+        except Exception as e:
+            logger.error(f"❌ Result callback error for job {job_id}: {e}")
+        finally:
+            with self.condition:
+                self.callbacks_pending -= 1
+                self.condition.notify_all()
+
+    def write_batch(self, results: Dict[str, Dict[str, Any]]) -> set:
+        """Write a batch of results in one transaction. Returns the jobIds that are persisted."""
+        from psycopg2.extras import execute_values
+
+        conn = self.pool.getconn()
+        try:
+            with conn:
+                with conn.cursor() as cur:
+                    cur.execute(
+                        """SELECT mj.id::text, mj.file_id, mj.user_id, mj.difficulty, mj.quiz_id, f.filename
+                           FROM mcq_jobs mj
+                           JOIN files f ON mj.file_id = f.id
+                           WHERE mj.id = ANY(%s::uuid[])
+                           FOR UPDATE OF mj""",
+                        (list(results),)
+                    )
+                    jobs = cur.fetchall()
+
+                    quizzes, questions, job_updates, file_updates = [], [], [], []
+                    already_done = set()
+                    for job_id, file_id, user_id, difficulty, quiz_id, filename in jobs:
+                        if quiz_id is not None:
+                            already_done.add(job_id)
+                            continue
+
+                        result = results[job_id]
+                        new_quiz_id = str(uuid.uuid4())
+                        quizzes.append((new_quiz_id, file_id, user_id, f"Quiz - {filename}",
+                                        result['total_questions'], 'active'))
+                        for mcq in result['mcqs']:
+                            questions.append((str(uuid.uuid4()), new_quiz_id, mcq['question'],
+                                              json.dumps(mcq['options']), mcq['correct_index'],
+                                              mcq.get('explanation'), difficulty or 'medium'))
+                        job_updates.append((job_id, new_quiz_id))
+                        file_updates.append((file_id, f"Text length: {result['text_length']} characters"))
+
+                    if quizzes:
+                        execute_values(
+                            cur,
+                            """INSERT INTO quizzes (id, file_id, user_id, title, question_count, status)
+                               VALUES %s""",
+                            quizzes
+                        )
+                        execute_values(
+                            cur,
+                            """INSERT INTO questions (id, quiz_id, question_text, options, correct_index, explanation, difficulty)
+                               VALUES %s""",
+                            questions,
+                            template="(%s, %s, %s, %s::jsonb, %s, %s, %s)",
+                            page_size=1000
+                        )
+                        execute_values(
+                            cur,
+                            """UPDATE mcq_jobs
+                               SET status = 'completed', progress = 100, quiz_id = v.quiz_id,
+                                   completed_at = CURRENT_TIMESTAMP, updated_at = CURRENT_TIMESTAMP
+                               FROM (VALUES %s) AS v(job_id, quiz_id)
+                               WHERE mcq_jobs.id = v.job_id""",
+                            job_updates,
+                            template="(%s::uuid, %s::uuid)"
+                        )
+                        execute_values(
+                            cur,
+                            """UPDATE files
+                               SET status = 'completed', extracted_text = v.summary, updated_at = CURRENT_TIMESTAMP
+                               FROM (VALUES %s) AS v(file_id, summary)
+                               WHERE files.id = v.file_id""",
+                            file_updates,
+                            template="(%s::uuid, %s)"
+                        )
+
+            if already_done:
+                logger.info(f"♻️ Skipped {len(already_done)} jobs that were already completed")
+            return {job_id for job_id, *_ in jobs}
+        finally:
+            self.pool.putconn(conn)
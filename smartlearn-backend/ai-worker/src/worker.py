@@ -1,13 +1,23 @@
 import os
+import sys
 import json
+import signal
 import asyncio
 import logging
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import requests
 from dotenv import load_dotenv
 
+from extraction.pdf_text import extract_text_from_pdf
+from pipeline import StagedPipeline, JobTracker
+from memory_budget import MemoryBudget, FileTooLargeError, MB
+from health_server import HealthServer
+from deadline import Deadline, DeadlineExceeded
+from llm.dedup import MCQDeduplicator
+
 # Load environment variables first
 load_dotenv()
 
@@ -27,6 +37,16 @@ class AIWorker:
         self.redis_url = os.getenv('REDIS_URL')
         self.backend_url = os.getenv('BACKEND_URL', 'http://localhost:3000')
         self.worker_secret = os.getenv('AI_WORKER_SECRET')
+        self.extraction_mode = os.getenv('PDF_EXTRACTION_MODE', 'layout')
+        self.max_file_bytes = int(os.getenv('MAX_FILE_MB', '50')) * MB
+        self.max_pdf_pages = int(os.getenv('MAX_PDF_PAGES', '200'))
+        self.job_timeout = float(os.getenv('JOB_TIMEOUT', '300'))
+        self.memory_budget = MemoryBudget(int(os.getenv('WORKER_MEMORY_BUDGET_MB', '1024')) * MB)
+        self.ready_max_queue_lag = float(os.getenv('READY_MAX_QUEUE_LAG', '30'))
+        self.ready_min_headroom = int(os.getenv('READY_MIN_HEADROOM_MB', '128')) * MB
+        self.pipeline = None
+        self.concurrent_jobs = int(os.getenv('CONCURRENT_JOBS', '2'))
+        self.job_tracker = JobTracker(["download", "extract", "generate", "send"], self.concurrent_jobs)
         
         if not all([self.redis_url, self.backend_url, self.worker_secret]):
             logger.error("❌ Missing required environment variables")
@@ -34,6 +54,9 @@ class AIWorker:
         
         # Initialize LLM client
         self.llm_client = self.setup_llm_client()
+        self.result_writer = self.setup_result_writer()
+        self.deduplicator = MCQDeduplicator(float(os.getenv('MCQ_DEDUP_THRESHOLD', '0.7')))
+        self.top_up_rounds = int(os.getenv('MCQ_TOP_UP_ROUNDS', '1'))
         logger.info("✅ AI Worker initialized successfully")
     
     def setup_llm_client(self):
@@ -55,46 +78,61 @@ class AIWorker:
             from llm.fallback_client import FallbackClient
             return FallbackClient()
     
-    def download_file(self, file_url: str) -> Optional[bytes]:
-        """Download file from URL"""
+    def setup_result_writer(self):
+        """Setup direct bulk persistence when enabled, otherwise results go over HTTP"""
+        if os.getenv('RESULT_PERSISTENCE', 'http') != 'direct':
+            return None
+        
+        database_url = os.getenv('DATABASE_URL')
+        if not database_url:
+            logger.warning("⚠️ RESULT_PERSISTENCE=direct but DATABASE_URL is not set, using HTTP")
+            return None
+        
         try:
-            logger.info(f"📥 Downloading file: {file_url[:100]}...")
-            response = requests.get(file_url, timeout=30)
-            response.raise_for_status()
-            
-            file_size = len(response.content)
-            logger.info(f"✅ File downloaded: {file_size} bytes")
-            return response.content
-            
+            from result_store import BulkResultWriter
+            return BulkResultWriter(
+                database_url,
+                batch_size=int(os.getenv('RESULT_BATCH_SIZE', '20')),
+                flush_interval=float(os.getenv('RESULT_FLUSH_INTERVAL', '0.5')),
+                pool_size=int(os.getenv('DB_POOL_SIZE', '4')),
+                max_pending=int(os.getenv('RESULT_MAX_PENDING', '100'))
+            )
         except Exception as e:
-            logger.error(f"❌ Failed to download file: {e}")
+            logger.error(f"❌ Failed to setup direct persistence, using HTTP: {e}")
             return None
     
-    def extract_text_from_pdf(self, pdf_content: bytes) -> Optional[str]:
-        """Extract text from PDF content"""
+    def download_file(self, file_url: str, reserve: Callable[[int], None] = None,
+                      deadline: Deadline = None) -> Optional[bytes]:
+        """Download file from URL, calling reserve(size) before the body is read"""
         try:
-            import fitz  # PyMuPDF
-            
-            logger.info("📄 Extracting text from PDF...")
-            doc = fitz.open(stream=pdf_content, filetype="pdf")
-            text = ""
-            
-            for page_num in range(len(doc)):
-                page = doc.load_page(page_num)
-                text += page.get_text()
-            
-            doc.close()
-            
-            text = text.strip()
-            if not text:
-                logger.warning("⚠️ No text extracted from PDF")
-                return None
+            logger.info(f"📥 Downloading file: {file_url[:100]}...")
+            timeout = deadline.timeout(30, "download") if deadline else 30
+            with requests.get(file_url, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                
+                declared_size = int(response.headers.get('Content-Length') or 0)
+                if declared_size > self.max_file_bytes:
+                    raise FileTooLargeError(
+                        f"File is {declared_size // MB} MB, limit is {self.max_file_bytes // MB} MB"
+                    )
+                if reserve:
+                    reserve(declared_size or self.max_file_bytes)
+                
+                content = bytearray()
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    content.extend(chunk)
+                    if deadline:
+                        deadline.check("download")
+                    if len(content) > self.max_file_bytes:
+                        raise FileTooLargeError(f"File exceeds {self.max_file_bytes // MB} MB limit")
             
-            logger.info(f"✅ Extracted {len(text)} characters from PDF")
-            return text
+            logger.info(f"✅ File downloaded: {len(content)} bytes")
+            return bytes(content)
             
+        except (FileTooLargeError, DeadlineExceeded):
+            raise
         except Exception as e:
-            logger.error(f"❌ PDF text extraction failed: {e}")
+            logger.error(f"❌ Failed to download file: {e}")
             return None
     
     def preprocess_text(self, text: str) -> str:
@@ -138,7 +176,7 @@ class AIWorker:
         except Exception as e:
             logger.error(f"❌ Progress update error: {e}")
     
-    def send_job_result(self, job_id: str, result: Dict[str, Any], endpoint: str):
+    def send_job_result(self, job_id: str, result: Dict[str, Any], endpoint: str, timeout: float = 30):
         """Send job result to backend"""
         try:
             response = requests.post(
@@ -148,7 +186,7 @@ class AIWorker:
                     "Authorization": f"Bearer {self.worker_secret}",
                     "Content-Type": "application/json"
                 },
-                timeout=30
+                timeout=timeout
             )
             
             if response.status_code == 200:
@@ -162,118 +200,315 @@ class AIWorker:
             logger.error(f"❌ Error sending result: {e}")
             return False
     
-    def process_job(self, job_data: Dict[str, Any]):
-        """Process a single MCQ generation job"""
-        job_id = job_data.get('jobId')
-        file_url = job_data.get('fileUrl')
-        question_count = job_data.get('questionCount', 5)
-        difficulty = job_data.get('difficulty', 'medium')
+    def new_job(self, job_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the job context passed between pipeline stages"""
+        return {
+            'job_id': job_data.get('jobId'),
+            'file_url': job_data.get('fileUrl'),
+            'question_count': job_data.get('questionCount', 5),
+            'difficulty': job_data.get('difficulty', 'medium'),
+            'extraction_mode': self.extraction_mode,
+            'max_pages': self.max_pdf_pages,
+            'deadline': Deadline.for_job(job_data, self.job_timeout),
+            'start_time': time.time()
+        }
+    
+    def download_stage(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Step 1: Download file"""
+        logger.info(f"🎯 Starting job: {job['job_id']}")
+        job['deadline'].check("download queue")
+        self.update_job_progress(job['job_id'], 10, "processing", "Downloading file")
+        pdf_content = self.download_file(job['file_url'], reserve=lambda size: self.admit_job(job, size),
+                                         deadline=job['deadline'])
+        if not pdf_content:
+            raise Exception("File download failed")
         
-        logger.info(f"🎯 Starting job: {job_id}")
-        start_time = time.time()
+        # Refine the reservation with the real size, covering as many pages as extraction may read.
+        # The page count is only known once the extraction process opens the PDF, which caps
+        # the pages it reads to what this reservation affords.
+        self.admit_job(job, len(pdf_content), job['max_pages'])
+        
+        self.update_job_progress(job['job_id'], 30, "processing", "Extracting text from PDF")
+        job['pdf_content'] = pdf_content
+        return job
+    
+    def admit_job(self, job: Dict[str, Any], file_size: int, page_count: Optional[int] = None):
+        """Reserve memory for a job, recording the grant so extraction can degrade to fit it"""
+        estimate = self.memory_budget.estimate(file_size, page_count)
+        if 'memory_granted' not in job and self.memory_budget.used() + estimate > self.memory_budget.total_bytes:
+            logger.info(f"⏳ Job {job['job_id']} waiting for memory ({self.memory_budget.stats()})")
         
         try:
-            # Step 1: Download file
-            self.update_job_progress(job_id, 10, "processing", "Downloading file")
-            pdf_content = self.download_file(file_url)
-            if not pdf_content:
-                raise Exception("File download failed")
-            
-            # Step 2: Extract text
-            self.update_job_progress(job_id, 30, "processing", "Extracting text from PDF")
-            text_content = self.extract_text_from_pdf(pdf_content)
-            if not text_content:
-                raise Exception("Text extraction failed")
-            
-            # Step 3: Generate MCQs
-            self.update_job_progress(job_id, 60, "processing", "Generating questions with AI")
-            processed_text = self.preprocess_text(text_content)
-            mcqs = self.llm_client.generate_mcqs(processed_text, question_count, difficulty)
-            
-            if not mcqs:
-                raise Exception("MCQ generation failed")
-            
-            # Step 4: Send results
-            self.update_job_progress(job_id, 90, "processing", "Saving results")
-            result = {
-                'job_id': job_id,
-                'status': 'completed',
-                'mcqs': mcqs,
-                'total_questions': len(mcqs),
-                'text_length': len(text_content),
-                'processed_at': datetime.now().isoformat()
-            }
-            
-            if self.send_job_result(job_id, result, "complete"):
-                self.update_job_progress(job_id, 100, "completed", "Job completed successfully")
-                processing_time = time.time() - start_time
-                logger.info(f"✅ Job {job_id} completed in {processing_time:.1f}s with {len(mcqs)} MCQs")
-            else:
-                raise Exception("Failed to send results to backend")
+            granted = self.memory_budget.acquire(job['job_id'], estimate, timeout=job['deadline'].remaining())
+        except TimeoutError:
+            raise DeadlineExceeded("Deadline exceeded while waiting for memory")
+        
+        job['file_size'] = file_size
+        job['memory_granted'] = granted
+    
+    def release_pdf_memory(self, job: Dict[str, Any]):
+        """After extraction the PDF is gone; keep only what the extracted text needs"""
+        self.memory_budget.acquire(job['job_id'], len(job['text_content']) * MemoryBudget.TEXT_OVERHEAD)
+    
+    def generate_stage(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Step 3: Generate MCQs"""
+        deadline = job['deadline']
+        deadline.check("generate queue")
+        self.update_job_progress(job['job_id'], 60, "processing", "Generating questions with AI")
+        processed_text = self.preprocess_text(job['text_content'])
+        mcqs = self.llm_client.generate_mcqs(processed_text, job['question_count'], job['difficulty'],
+                                             timeout=deadline.timeout(45, "generate"))
+        
+        # A timed-out LLM call returns fallback questions; don't ship them past the deadline
+        deadline.check("generate")
+        if not mcqs:
+            raise Exception("MCQ generation failed")
+        
+        if any(mcq.get('placeholder') for mcq in mcqs):
+            # The LLM call failed; there is nothing real to deduplicate or top up
+            job['mcqs'] = mcqs
+        else:
+            job['mcqs'] = self.top_up_mcqs(job, processed_text, self.deduplicator.deduplicate(mcqs))
+        return job
+    
+    def top_up_mcqs(self, job: Dict[str, Any], text: str, mcqs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Request only the questions lost to deduplication, excluding the ones already kept"""
+        question_count = job['question_count']
+        deadline = job['deadline']
+        
+        for _ in range(self.top_up_rounds):
+            missing = question_count - len(mcqs)
+            # Leave the top-up out rather than fail a job that already has questions
+            if missing <= 0 or deadline.remaining() < 5:
+                break
             
+            logger.info(f"➕ Requesting {missing} more MCQs after deduplication")
+            extra = self.llm_client.generate_mcqs(
+                text, missing, job['difficulty'],
+                timeout=deadline.timeout(45, "generate"),
+                exclude=[mcq['question'] for mcq in mcqs]
+            )
+            # A failed top-up call returns placeholder questions; never mix them into real ones
+            extra = [mcq for mcq in (extra or []) if not mcq.get('placeholder')]
+            if not extra:
+                logger.warning("⚠️ Top-up generation failed, keeping deduplicated questions")
+                break
+            mcqs = self.deduplicator.deduplicate(mcqs + extra)
+        
+        return mcqs[:question_count]
+    
+    def send_stage(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """Step 4: Send results"""
+        job_id = job['job_id']
+        mcqs = job['mcqs']
+        job['deadline'].check("send queue")
+        self.update_job_progress(job_id, 90, "processing", "Saving results")
+        result = {
+            'job_id': job_id,
+            'status': 'completed',
+            'mcqs': mcqs,
+            'total_questions': len(mcqs),
+            'text_length': len(job['text_content']),
+            'processed_at': datetime.now().isoformat()
+        }
+        
+        if self.result_writer:
+            # Batched direct write; completion is reported from the writer thread
+            self.memory_budget.release(job_id)
+            self.result_writer.submit(job_id, result, lambda persisted: self.finish_direct(job, result, persisted))
+        elif self.send_job_result(job_id, result, "complete", timeout=job['deadline'].timeout(30, "send")):
+            self.memory_budget.release(job_id)
+            self.update_job_progress(job_id, 100, "completed", "Job completed successfully")
+            processing_time = time.time() - job['start_time']
+            logger.info(f"✅ Job {job_id} completed in {processing_time:.1f}s with {len(mcqs)} MCQs")
+        else:
+            raise Exception("Failed to send results to backend")
+        
+        return job
+    
+    def finish_direct(self, job: Dict[str, Any], result: Dict[str, Any], persisted: bool):
+        """Complete a job after its batch write, falling back to the backend API on failure"""
+        job_id = job['job_id']
+        if not persisted and not self.send_job_result(job_id, result, "complete"):
+            self.fail_job(job, Exception("Failed to persist results"))
+            return
+        
+        processing_time = time.time() - job['start_time']
+        logger.info(f"✅ Job {job_id} completed in {processing_time:.1f}s with {result['total_questions']} MCQs")
+    
+    def fail_job(self, job: Dict[str, Any], error: Exception, stage: str = None):
+        """Notify backend about a failed job"""
+        job_id = job['job_id']
+        self.memory_budget.release(job_id)
+        error_msg = f"Job failed: {str(error)}"
+        logger.error(f"❌ {error_msg}" + (f" (stage: {stage})" if stage else ""))
+        
+        error_result = {
+            'job_id': job_id,
+            'status': 'failed',
+            'error': error_msg,
+            'failed_at': datetime.now().isoformat()
+        }
+        self.send_job_result(job_id, error_result, "fail")
+        self.update_job_progress(job_id, 0, "failed", error_msg)
+    
+    def process_job(self, job_data: Dict[str, Any]):
+        """Process a single MCQ generation job"""
+        job = self.new_job(job_data)
+        tracker = self.job_tracker
+        tracker.track_job(1)
+        
+        try:
+            job = tracker.run("download", self.download_stage, job)
+            job = tracker.run("extract", run_extract_stage, job)
+            self.release_pdf_memory(job)
+            job = tracker.run("generate", self.generate_stage, job)
+            tracker.run("send", self.send_stage, job)
         except Exception as e:
-            error_msg = f"Job failed: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            self.fail_job(job, e)
+        finally:
+            tracker.track_job(-1)
+    
+    def build_pipeline(self) -> StagedPipeline:
+        """Build the staged pipeline: I/O pool → CPU process pool → LLM slots → I/O pool"""
+        download_workers = int(os.getenv('DOWNLOAD_CONCURRENCY', '4'))
+        extract_workers = int(os.getenv('EXTRACT_PROCESSES', str(min(4, os.cpu_count() or 1))))
+        llm_slots = int(os.getenv('LLM_CONCURRENCY', os.getenv('CONCURRENT_JOBS', '2')))
+        send_workers = int(os.getenv('SEND_CONCURRENCY', '2'))
+        queue_size = int(os.getenv('STAGE_QUEUE_SIZE', '4'))
+        
+        pipeline = StagedPipeline(on_error=lambda job, stage, e: self.fail_job(job, e, stage))
+        pipeline.add_stage("download", self.download_stage,
+                           lambda: ThreadPoolExecutor(download_workers, thread_name_prefix="io"),
+                           download_workers, queue_size)
+        pipeline.add_stage("extract", run_extract_stage,
+                           lambda: ProcessPoolExecutor(extract_workers),
+                           extract_workers, queue_size, on_result=self.release_pdf_memory)
+        pipeline.add_stage("generate", self.generate_stage,
+                           lambda: ThreadPoolExecutor(llm_slots, thread_name_prefix="llm"),
+                           llm_slots, queue_size)
+        pipeline.add_stage("send", self.send_stage,
+                           lambda: ThreadPoolExecutor(send_workers, thread_name_prefix="send"),
+                           send_workers, queue_size)
+        return pipeline
+    
+    def health_report(self):
+        """Load report for the health endpoints: (live, ready, details)"""
+        memory = self.memory_budget.stats()
+        llm = {
+            'provider': type(self.llm_client).__name__,
+            'last_rate_limited_at': getattr(self.llm_client, 'last_rate_limited_at', None)
+        }
+        details = {'memory': memory, 'llm': llm}
+        saturated = []
+        live = True
+        
+        if self.pipeline:
+            stages = self.pipeline.stats()
+            queue_lag = max(stage['queue_lag_seconds'] for stage in stages.values())
+            llm.update(slots_in_use=stages['generate']['active'], slots=stages['generate']['concurrency'])
+            details.update(in_flight=self.pipeline.in_flight, queue_lag_seconds=queue_lag, stages=stages)
+            live = self.pipeline.alive()
+            
+            if self.pipeline.is_full():
+                saturated.append("download queue full")
+            if queue_lag > self.ready_max_queue_lag:
+                saturated.append(f"queue lag {queue_lag:.0f}s")
+        else:
+            # BullMQ path: the queue lives in Redis, so report jobs and stage latencies here
+            tracker = self.job_tracker
+            stages = tracker.stats()
+            llm.update(slots_in_use=stages['generate']['active'], slots=tracker.concurrency)
+            details.update(in_flight=tracker.in_flight, queue_lag_seconds=None, stages=stages)
             
-            # Notify backend about failure
-            error_result = {
-                'job_id': job_id,
-                'status': 'failed',
-                'error': error_msg,
-                'failed_at': datetime.now().isoformat()
-            }
-            self.send_job_result(job_id, error_result, "fail")
-            self.update_job_progress(job_id, 0, "failed", error_msg)
+            if tracker.is_full():
+                saturated.append("all job slots busy")
+        
+        if self.memory_budget.total_bytes - self.memory_budget.used() < self.ready_min_headroom:
+            saturated.append("low memory headroom")
+        
+        details['saturated'] = saturated
+        return live, live and not saturated, details
     
     def start_worker(self):
         """Start the worker with available method"""
+        health_port = int(os.getenv('HEALTH_PORT', '8000'))
         try:
-            # Try BullMQ first
-            from bullmq import Worker
-            logger.info("🚀 Starting BullMQ Worker...")
+            try:
+                HealthServer(self.health_report, health_port).start()
+            except OSError as e:
+                # Container probes target this port; a worker without it would be restarted as unhealthy
+                raise RuntimeError(f"Health endpoints unavailable on port {health_port}: {e}") from e
             
-            worker = Worker(
-                "mcq-generation",
-                lambda job: self.process_job(job.data),
-                {"connection": self.redis_url, "concurrency": 2}
-            )
+            try:
+                # Try BullMQ first
+                from bullmq import Worker
+                logger.info("🚀 Starting BullMQ Worker...")
             
-            logger.info("✅ BullMQ Worker started successfully")
-            asyncio.get_event_loop().run_forever()
+                worker = Worker(
+                    "mcq-generation",
+                    lambda job: self.process_job(job.data),
+                    {"connection": self.redis_url, "concurrency": self.concurrent_jobs}
+                )
             
-        except ImportError:
-            # Fallback to Redis pub/sub
-            logger.info("🔄 Starting Redis Pub/Sub Worker...")
-            import redis
+                logger.info("✅ BullMQ Worker started successfully")
+                asyncio.get_event_loop().run_forever()
             
-            redis_client = redis.from_url(self.redis_url, decode_responses=True)
-            pubsub = redis_client.pubsub()
-            pubsub.subscribe('mcq_jobs')
+            except ImportError:
+                # Fallback to Redis pub/sub
+                logger.info("🔄 Starting Redis Pub/Sub Worker...")
+                import redis
             
-            logger.info("✅ Listening for jobs on 'mcq_jobs' channel")
+                redis_client = redis.from_url(self.redis_url, decode_responses=True)
+                pubsub = redis_client.pubsub()
+                pubsub.subscribe('mcq_jobs')
             
-            try:
-                for message in pubsub.listen():
-                    if message['type'] == 'message':
-                        try:
-                            job_data = json.loads(message['data'])
-                            # Process in background thread to avoid blocking
-                            import threading
-                            thread = threading.Thread(target=self.process_job, args=(job_data,))
-                            thread.daemon = True
-                            thread.start()
-                        except Exception as e:
-                            logger.error(f"❌ Error processing message: {e}")
-            except KeyboardInterrupt:
-                logger.info("🛑 Worker stopped by user")
-            except Exception as e:
-                logger.error(f"💥 Worker crashed: {e}")
-            finally:
-                pubsub.close()
+                pipeline = self.pipeline = self.build_pipeline()
+                pipeline.start()
+                logger.info("✅ Listening for jobs on 'mcq_jobs' channel")
+            
+                try:
+                    for message in pubsub.listen():
+                        if message['type'] == 'message':
+                            try:
+                                job_data = json.loads(message['data'])
+                                # Blocks while every stage queue is full
+                                pipeline.submit(self.new_job(job_data))
+                                logger.info(f"📦 Pipeline queues: {pipeline.stats()}")
+                            except Exception as e:
+                                logger.error(f"❌ Error processing message: {e}")
+                except KeyboardInterrupt:
+                    logger.info("🛑 Worker stopped by user")
+                except Exception as e:
+                    logger.error(f"💥 Worker crashed: {e}")
+                finally:
+                    pubsub.close()
+                    pipeline.shutdown(wait=False)
+        finally:
+            # Flush buffered direct-persistence results before the process exits
+            if self.result_writer:
+                self.result_writer.close()
+
+def run_extract_stage(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Step 2: Extract text (runs in the extraction process pool)"""
+    pdf_content = job.pop('pdf_content')
+    job['deadline'].check("extract queue")
+    # Read no more pages than the job's memory reservation covers
+    max_pages = min(job['max_pages'], MemoryBudget.page_cap(job['file_size'], job['memory_granted']))
+    text_content = extract_text_from_pdf(pdf_content, job['extraction_mode'], max_pages, job['deadline'])
+    if not text_content:
+        raise Exception("Text extraction failed")
+    
+    job['text_content'] = text_content
+    return job
 
 if __name__ == "__main__":
+    # docker stop sends SIGTERM; exit through the finally blocks so results get flushed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
     try:
         worker = AIWorker()
         worker.start_worker()
     except Exception as e:
-        logger.error(f"💥 Failed to start worker: {e}")
\ No newline at end of file
+        logger.error(f"💥 Failed to start worker: {e}")
+        sys.exit(1)
\ No newline at end of file
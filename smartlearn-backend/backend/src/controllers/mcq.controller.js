@@ -5,6 +5,9 @@ import { logger } from '../utils/logger.js';
 import { AppError, ConflictError, NotFoundError } from '../utils/error.js';
 import { publishJob } from '../config/redis.js'
 
+// Lifetime of the signed file URL handed to the AI worker; also bounds the job's deadline
+const FILE_URL_TTL_SECONDS = 3600;
+
 export const generateMCQ = async (req, res, next) => {
   const client = await pool.connect();
   try {
@@ -46,8 +49,9 @@ export const generateMCQ = async (req, res, next) => {
       [jobId, userId, fileId, questionCount, difficulty, 'pending', 0]
     );
 
-    // Get file download URL for worker
-    const fileUrl = await getFileUrl(file.storage_key, 3600);
+    // Get file download URL for worker; the deadline is taken first so it never outlives the URL
+    const deadline = Date.now() + FILE_URL_TTL_SECONDS * 1000;
+    const fileUrl = await getFileUrl(file.storage_key, FILE_URL_TTL_SECONDS);
 
     await client.query('COMMIT');
 
@@ -59,7 +63,9 @@ export const generateMCQ = async (req, res, next) => {
       fileUrl,
       questionCount,
       difficulty,
-      focusAreas: focusAreas || []
+      focusAreas: focusAreas || [],
+      // Worker stops processing once the signed fileUrl has expired
+      deadline
     };
 
     console.log('📨 Publishing job to AI worker:', jobId);